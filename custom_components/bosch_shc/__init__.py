@@ -173,15 +173,13 @@ class SwitchDeviceEventListener:
         self.hass = hass
         self.entry = entry
         self._device = device
-        self._service = None
         self.device_id = None
 
-        for service in self._device.device_services:
-            if service.id == "Keypad":
-                self._service = service
-                self._service.subscribe_callback(
-                    self._device.id, self._async_input_events_handler
-                )
+        self._service = self._device.device_service("Keypad")
+        if self._service is not None:
+            self._service.subscribe_callback(
+                self._device.id, self._async_input_events_handler
+            )
 
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._handle_ha_stop)
 
@@ -1,8 +1,8 @@
 """Platform for binarysensor integration."""
-import asyncio
 import logging
-from datetime import datetime, timedelta
-from .device import SHCDevice
+import time
+from datetime import datetime, timezone
+from itertools import chain
 from .models_impl import SHCBatteryDevice, SHCShutterContact, SHCSmokeDetectionSystem, SHCSmokeDetector, SHCWaterLeakageSensor
 from .session import SHCSession
 
@@ -18,12 +18,12 @@ from homeassistant.const import (
     ATTR_DEVICE_ID,
     ATTR_ID,
     ATTR_NAME,
-    EVENT_HOMEASSISTANT_STOP,
     Platform,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import callback
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.event import async_call_later
 
 from .const import (
     ATTR_EVENT_SUBTYPE,
@@ -35,46 +35,44 @@ from .const import (
     SERVICE_SMOKEDETECTOR_ALARMSTATE,
     SERVICE_SMOKEDETECTOR_CHECK,
 )
-from .entity import SHCEntity, async_get_device_id, migrate_old_unique_ids
+from .entity import (
+    SHCEntity,
+    SHCEventListenerEntity,
+    async_add_entities_batched,
+    migrate_old_unique_ids,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+MOTION_TIMEOUT = 4 * 60
+
+SHUTTER_CONTACT_DEVICE_CLASSES = {
+    "ENTRANCE_DOOR": BinarySensorDeviceClass.DOOR,
+    "REGULAR_WINDOW": BinarySensorDeviceClass.WINDOW,
+    "FRENCH_WINDOW": BinarySensorDeviceClass.DOOR,
+    "GENERIC": BinarySensorDeviceClass.WINDOW,
+}
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up the SHC binary sensor platform."""
     entities = []
     session: SHCSession = hass.data[DOMAIN][config_entry.entry_id][DATA_SESSION]
 
-    for binary_sensor in session.device_helper.shutter_contacts:
-        entities.append(
-            ShutterContactSensor(
-                device=binary_sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
+    parent_id = session.information.unique_id
+    device_helper = session.device_helper
 
-    for binary_sensor in session.device_helper.motion_detectors:
-        entities.append(
-            MotionDetectionSensor(
-                hass=hass,
-                device=binary_sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-
-    for binary_sensor in session.device_helper.smoke_detectors:
-        entities.append(
-            SmokeDetectorSensor(
-                device=binary_sensor,
-                parent_id=session.information.unique_id,
-                hass=hass,
-                entry_id=config_entry.entry_id,
+    for attr, sensor_class in BINARY_SENSOR_TYPES:
+        for binary_sensor in getattr(device_helper, attr):
+            entities.append(
+                sensor_class(
+                    device=binary_sensor,
+                    parent_id=parent_id,
+                    entry_id=config_entry.entry_id,
+                )
             )
-        )
 
-    binary_sensor = session.device_helper.smoke_detection_system
+    binary_sensor = device_helper.smoke_detection_system
     if binary_sensor:
         migrate_old_unique_ids(
             hass,
@@ -85,36 +83,19 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         entities.append(
             SmokeDetectionSystemSensor(
                 device=binary_sensor,
-                parent_id=session.information.unique_id,
-                hass=hass,
+                parent_id=parent_id,
                 entry_id=config_entry.entry_id,
             )
         )
 
-    for binary_sensor in session.device_helper.water_leakage_detectors:
-        entities.append(
-            WaterLeakageDetectorSensor(
-                device=binary_sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-
-    for binary_sensor in (
-        session.device_helper.motion_detectors
-        + session.device_helper.shutter_contacts
-        + session.device_helper.smoke_detectors
-        + session.device_helper.thermostats
-        + session.device_helper.twinguards
-        + session.device_helper.universal_switches
-        + session.device_helper.wallthermostats
-        + session.device_helper.water_leakage_detectors
+    for binary_sensor in chain.from_iterable(
+        getattr(device_helper, attr) for attr in BATTERY_SENSOR_DEVICES
     ):
         if binary_sensor.supports_batterylevel:
             entities.append(
                 BatterySensor(
                     device=binary_sensor,
-                    parent_id=session.information.unique_id,
+                    parent_id=parent_id,
                     entry_id=config_entry.entry_id,
                 )
             )
@@ -135,48 +116,98 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     )
 
     if entities:
-        async_add_entities(entities)
+        await async_add_entities_batched(async_add_entities, entities)
+
+
+def _set_alarmstate(device: SHCSmokeDetector, command: str) -> None:
+    """Set the alarm state of a smoke detector."""
+    device.alarmstate = command
 
 
 class ShutterContactSensor(SHCEntity, BinarySensorEntity):
     """Representation of a SHC shutter contact sensor."""
 
-    @property
-    def is_on(self):
-        """Return the state of the sensor."""
-        return self._device.state == SHCShutterContact.ShutterContactService.State.OPEN
+    def __init__(
+        self, device: SHCShutterContact, parent_id: str, entry_id: str
+    ) -> None:
+        """Initialize the shutter contact device."""
+        super().__init__(device=device, parent_id=parent_id, entry_id=entry_id)
+        self._attr_device_class = SHUTTER_CONTACT_DEVICE_CLASSES.get(
+            device.device_class, BinarySensorDeviceClass.WINDOW
+        )
 
-    @property
-    def device_class(self):
-        """Return the class of this device."""
-        switcher = {
-            "ENTRANCE_DOOR": BinarySensorDeviceClass.DOOR,
-            "REGULAR_WINDOW": BinarySensorDeviceClass.WINDOW,
-            "FRENCH_WINDOW": BinarySensorDeviceClass.DOOR,
-            "GENERIC": BinarySensorDeviceClass.WINDOW,
-        }
-        return switcher.get(self._device.device_class, BinarySensorDeviceClass.WINDOW)
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the cached entity attributes from the device state."""
+        self._attr_is_on = (
+            self._device.state == SHCShutterContact.ShutterContactService.State.OPEN
+        )
 
 
-class MotionDetectionSensor(SHCEntity, BinarySensorEntity):
+class MotionDetectionSensor(SHCEventListenerEntity, BinarySensorEntity):
     """Representation of a SHC motion detection sensor."""
 
+    __slots__ = ("_clear_motion_unsub", "_latestmotion")
+
     _attr_device_class = BinarySensorDeviceClass.MOTION
+    _EVENT_SERVICE_ID = "LatestMotion"
 
-    def __init__(self, hass, device, parent_id: str, entry_id: str):
+    def __init__(self, device, parent_id: str, entry_id: str):
         """Initialize the motion detection device."""
-        self.hass = hass
-        self._service = None
+        self._clear_motion_unsub = None
+        self._latestmotion = (None, None)
         super().__init__(device=device, parent_id=parent_id, entry_id=entry_id)
 
-        for service in self._device.device_services:
-            if service.id == "LatestMotion":
-                self._service = service
-                self._service.subscribe_callback(
-                    self._device.id + "_eventlistener", self._async_input_events_handler
+    async def async_will_remove_from_hass(self):
+        """Cancel the pending motion clear timer."""
+        await super().async_will_remove_from_hass()
+        if self._clear_motion_unsub is not None:
+            self._clear_motion_unsub()
+            self._clear_motion_unsub = None
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the motion state and schedule clearing it after the timeout."""
+        self._attr_extra_state_attributes = {
+            "last_motion_detected": self._device.latestmotion,
+        }
+        if self._clear_motion_unsub is not None:
+            self._clear_motion_unsub()
+            self._clear_motion_unsub = None
+
+        latestmotion = self._parse_latestmotion()
+        if latestmotion is None:
+            self._attr_is_on = False
+            return
+
+        remaining = latestmotion + MOTION_TIMEOUT - time.time()
+        self._attr_is_on = remaining > 0
+        if self._attr_is_on:
+            self._clear_motion_unsub = async_call_later(
+                self.hass, remaining, self._async_clear_motion
+            )
+
+    def _parse_latestmotion(self):
+        """Return the latest motion epoch time, parsing it only when it changed."""
+        raw = self._device.latestmotion
+        if raw != self._latestmotion[0]:
+            try:
+                parsed = (
+                    datetime.fromisoformat(raw.rstrip("Z"))
+                    .replace(tzinfo=timezone.utc)
+                    .timestamp()
                 )
+            except ValueError:
+                parsed = None
+            self._latestmotion = (raw, parsed)
+        return self._latestmotion[1]
 
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._handle_ha_stop)
+    @callback
+    def _async_clear_motion(self, _now):
+        """Clear the motion state once the timeout has elapsed."""
+        self._clear_motion_unsub = None
+        self._attr_is_on = False
+        self.async_write_ha_state()
 
     @callback
     def _async_input_events_handler(self):
@@ -184,9 +215,7 @@ class MotionDetectionSensor(SHCEntity, BinarySensorEntity):
         self.hass.bus.async_fire(
             EVENT_BOSCH_SHC,
             {
-                ATTR_DEVICE_ID: asyncio.run_coroutine_threadsafe(
-                    async_get_device_id(self.hass, self._device.id), self.hass.loop
-                ).result(),
+                ATTR_DEVICE_ID: self._cached_device_id,
                 ATTR_ID: self._device.id,
                 ATTR_NAME: self._device.name,
                 ATTR_LAST_TIME_TRIGGERED: self._device.latestmotion,
@@ -195,77 +224,20 @@ class MotionDetectionSensor(SHCEntity, BinarySensorEntity):
             },
         )
 
-    @callback
-    def _handle_ha_stop(self, _):
-        """Handle Home Assistant stopping."""
-        _LOGGER.debug(
-            "Stopping motion detection event listener for %s", self._device.name
-        )
-        self._service.unsubscribe_callback(self._device.id + "_eventlistener")
-
-    @property
-    def is_on(self):
-        """Return the state of the sensor."""
-        try:
-            latestmotion = datetime.strptime(
-                self._device.latestmotion, "%Y-%m-%dT%H:%M:%S.%fZ"
-            )
-        except ValueError:
-            return False
-
-        elapsed = datetime.utcnow() - latestmotion
-        if elapsed > timedelta(seconds=4 * 60):
-            return False
-        return True
-
-    @property
-    def should_poll(self):
-        """Retrieve motion state."""
-        return True
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        return {
-            "last_motion_detected": self._device.latestmotion,
-        }
-
-
-class SmokeDetectorSensor(SHCEntity, BinarySensorEntity):
+class SmokeDetectorSensor(SHCEventListenerEntity, BinarySensorEntity):
     """Representation of a SHC smoke detector sensor."""
 
     _attr_device_class = BinarySensorDeviceClass.SMOKE
-
-    def __init__(
-        self,
-        device: SHCSmokeDetector,
-        parent_id: str,
-        hass: HomeAssistant,
-        entry_id: str,
-    ):
-        """Initialize the smoke detector device."""
-        self._hass = hass
-        self._service = None
-        super().__init__(device=device, parent_id=parent_id, entry_id=entry_id)
-
-        for service in self._device.device_services:
-            if service.id == "Alarm":
-                self._service = service
-                self._service.subscribe_callback(
-                    self._device.id + "_eventlistener", self._async_input_events_handler
-                )
-
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._handle_ha_stop)
+    _EVENT_SERVICE_ID = "Alarm"
 
     @callback
     def _async_input_events_handler(self):
         """Handle device input events."""
-        self._hass.bus.async_fire(
+        self.hass.bus.async_fire(
             EVENT_BOSCH_SHC,
             {
-                ATTR_DEVICE_ID: asyncio.run_coroutine_threadsafe(
-                    async_get_device_id(self._hass, self._device.id), self._hass.loop
-                ).result(),
+                ATTR_DEVICE_ID: self._cached_device_id,
                 ATTR_ID: self._device.id,
                 ATTR_NAME: self._device.name,
                 ATTR_EVENT_TYPE: "ALARM",
@@ -274,15 +246,15 @@ class SmokeDetectorSensor(SHCEntity, BinarySensorEntity):
         )
 
     @callback
-    def _handle_ha_stop(self, _):
-        """Handle Home Assistant stopping."""
-        _LOGGER.debug("Stopping alarm event listener for %s", self._device.name)
-        self._service.unsubscribe_callback(self._device.id + "_eventlistener")
-
-    @property
-    def is_on(self):
-        """Return the state of the sensor."""
-        return self._device.alarmstate != SHCSmokeDetector.AlarmService.State.IDLE_OFF
+    def _async_update_attrs(self) -> None:
+        """Update the cached entity attributes from the device state."""
+        self._attr_extra_state_attributes = {
+            "smokedetectorcheck_state": self._device.smokedetectorcheck_state.name,
+            "alarmstate": self._device.alarmstate.name,
+        }
+        self._attr_is_on = (
+            self._device.alarmstate != SHCSmokeDetector.AlarmService.State.IDLE_OFF
+        )
 
     @property
     def icon(self):
@@ -292,26 +264,14 @@ class SmokeDetectorSensor(SHCEntity, BinarySensorEntity):
     async def async_request_smoketest(self):
         """Request smokedetector test."""
         _LOGGER.debug("Requesting smoke test on entity %s", self.name)
-        await self._hass.async_add_executor_job(self._device.smoketest_requested)
+        await self.hass.async_add_executor_job(self._device.smoketest_requested)
 
     async def async_request_alarmstate(self, command: str):
         """Request smokedetector alarm state."""
-
-        def set_alarmstate(device, command):
-            device.alarmstate = command
-
         _LOGGER.debug(
             "Requesting custom alarm state %s on entity %s", command, self.name
         )
-        await self._hass.async_add_executor_job(set_alarmstate, self._device, command)
-
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        return {
-            "smokedetectorcheck_state": self._device.smokedetectorcheck_state.name,
-            "alarmstate": self._device.alarmstate.name,
-        }
+        await self.hass.async_add_executor_job(_set_alarmstate, self._device, command)
 
 
 class WaterLeakageDetectorSensor(SHCEntity, BinarySensorEntity):
@@ -319,10 +279,14 @@ class WaterLeakageDetectorSensor(SHCEntity, BinarySensorEntity):
 
     _attr_device_class = BinarySensorDeviceClass.MOISTURE
 
-    @property
-    def is_on(self):
-        """Return the state of the sensor."""
-        return (
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the cached entity attributes from the device state."""
+        self._attr_extra_state_attributes = {
+            "push_notification_state": self._device.push_notification_state.name,
+            "acoustic_signal_state": self._device.acoustic_signal_state.name,
+        }
+        self._attr_is_on = (
             self._device.leakage_state
             != SHCWaterLeakageSensor.WaterLeakageSensorService.State.NO_LEAKAGE
         )
@@ -332,51 +296,27 @@ class WaterLeakageDetectorSensor(SHCEntity, BinarySensorEntity):
         """Return the icon of the sensor."""
         return "mdi:water-alert"
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        return {
-            "push_notification_state": self._device.push_notification_state.name,
-            "acoustic_signal_state": self._device.acoustic_signal_state.name,
-        }
-
 
-class SmokeDetectionSystemSensor(SHCEntity, BinarySensorEntity):
+class SmokeDetectionSystemSensor(SHCEventListenerEntity, BinarySensorEntity):
     """Representation of a SHC smoke detection system sensor."""
 
     _attr_device_class = BinarySensorDeviceClass.SMOKE
+    _EVENT_SERVICE_ID = "SurveillanceAlarm"
 
     def __init__(
-        self,
-        device: SHCSmokeDetectionSystem,
-        parent_id: str,
-        hass: HomeAssistant,
-        entry_id: str,
-    ):
+        self, device: SHCSmokeDetectionSystem, parent_id: str, entry_id: str
+    ) -> None:
         """Initialize the smoke detection system device."""
-        self._hass = hass
-        self._service = None
         super().__init__(device=device, parent_id=parent_id, entry_id=entry_id)
         self._attr_unique_id = f"{device.root_device_id}_{device.serial}"
 
-        for service in self._device.device_services:
-            if service.id == "SurveillanceAlarm":
-                self._service = service
-                self._service.subscribe_callback(
-                    self._device.id + "_eventlistener", self._async_input_events_handler
-                )
-
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._handle_ha_stop)
-
     @callback
     def _async_input_events_handler(self):
         """Handle device input events."""
-        self._hass.bus.async_fire(
+        self.hass.bus.async_fire(
             EVENT_BOSCH_SHC,
             {
-                ATTR_DEVICE_ID: asyncio.run_coroutine_threadsafe(
-                    async_get_device_id(self._hass, self._device.id), self._hass.loop
-                ).result(),
+                ATTR_DEVICE_ID: self._cached_device_id,
                 ATTR_ID: self._device.id,
                 ATTR_NAME: self._device.name,
                 ATTR_EVENT_TYPE: "ALARM",
@@ -385,15 +325,12 @@ class SmokeDetectionSystemSensor(SHCEntity, BinarySensorEntity):
         )
 
     @callback
-    def _handle_ha_stop(self, _):
-        """Handle Home Assistant stopping."""
-        _LOGGER.debug("Stopping alarm event listener for %s", self._device.name)
-        self._service.unsubscribe_callback(self._device.id + "_eventlistener")
-
-    @property
-    def is_on(self):
-        """Return the state of the sensor."""
-        return (
+    def _async_update_attrs(self) -> None:
+        """Update the cached entity attributes from the device state."""
+        self._attr_extra_state_attributes = {
+            "alarm_state": self._device.alarm.name,
+        }
+        self._attr_is_on = (
             self._device.alarm
             != SHCSmokeDetectionSystem.SurveillanceAlarmService.State.ALARM_OFF
         )
@@ -403,47 +340,56 @@ class SmokeDetectionSystemSensor(SHCEntity, BinarySensorEntity):
         """Return the icon of the sensor."""
         return "mdi:smoke-detector"
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        return {
-            "alarm_state": self._device.alarm.name,
-        }
-
 
 class BatterySensor(SHCEntity, BinarySensorEntity):
     """Representation of a SHC battery reporting sensor."""
 
+    __slots__ = ("_batterylevel",)
+
     _attr_device_class = BinarySensorDeviceClass.BATTERY
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _NAME_SUFFIX = " Battery"
+    _UID_SUFFIX = "_battery"
 
-    def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
-        """Initialize an SHC temperature reporting sensor."""
-        super().__init__(device, parent_id, entry_id)
-        self._attr_name = f"{device.name} Battery"
-        self._attr_unique_id = f"{device.serial}_battery"
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+    def __init__(self, device: SHCBatteryDevice, parent_id: str, entry_id: str) -> None:
+        """Initialize the battery reporting device."""
+        self._batterylevel = None
+        super().__init__(device=device, parent_id=parent_id, entry_id=entry_id)
 
-    @property
-    def is_on(self):
-        """Return the state of the sensor."""
-        if (
-            self._device.batterylevel
-            == SHCBatteryDevice.BatteryLevelService.State.NOT_AVAILABLE
-        ):
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the cached entity attributes from the device state."""
+        batterylevel = self._device.batterylevel
+        if batterylevel != self._batterylevel:
+            self._batterylevel = batterylevel
+            self._log_battery_level(batterylevel)
+
+        self._attr_is_on = batterylevel != SHCBatteryDevice.BatteryLevelService.State.OK
+
+    def _log_battery_level(self, batterylevel) -> None:
+        """Log a changed battery level that needs attention."""
+        if batterylevel == SHCBatteryDevice.BatteryLevelService.State.NOT_AVAILABLE:
             _LOGGER.debug("Battery state of device %s is not available", self.name)
-
-        if (
-            self._device.batterylevel
-            == SHCBatteryDevice.BatteryLevelService.State.CRITICAL_LOW
-        ):
+        elif batterylevel == SHCBatteryDevice.BatteryLevelService.State.CRITICAL_LOW:
             _LOGGER.warning("Battery state of device %s is critical low", self.name)
-
-        if (
-            self._device.batterylevel
-            == SHCBatteryDevice.BatteryLevelService.State.LOW_BATTERY
-        ):
+        elif batterylevel == SHCBatteryDevice.BatteryLevelService.State.LOW_BATTERY:
             _LOGGER.warning("Battery state of device %s is low", self.name)
 
-        return (
-            self._device.batterylevel != SHCBatteryDevice.BatteryLevelService.State.OK
-        )
+
+BINARY_SENSOR_TYPES = (
+    ("shutter_contacts", ShutterContactSensor),
+    ("motion_detectors", MotionDetectionSensor),
+    ("smoke_detectors", SmokeDetectorSensor),
+    ("water_leakage_detectors", WaterLeakageDetectorSensor),
+)
+
+BATTERY_SENSOR_DEVICES = (
+    "motion_detectors",
+    "shutter_contacts",
+    "smoke_detectors",
+    "thermostats",
+    "twinguards",
+    "universal_switches",
+    "wallthermostats",
+    "water_leakage_detectors",
+)
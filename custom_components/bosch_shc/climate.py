@@ -18,7 +18,7 @@ from homeassistant.components.climate.const import (
 from homeassistant.const import ATTR_TEMPERATURE, TEMP_CELSIUS, Platform
 
 from .const import DATA_SESSION, DOMAIN
-from .entity import SHCEntity, migrate_old_unique_ids
+from .entity import SHCEntity, async_add_entities_batched, migrate_old_unique_ids
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,7 +46,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         )
 
     if entities:
-        async_add_entities(entities)
+        await async_add_entities_batched(async_add_entities, entities)
 
 
 class ClimateControl(SHCEntity, ClimateEntity):
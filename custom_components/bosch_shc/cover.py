@@ -16,7 +16,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DATA_SESSION, DOMAIN
-from .entity import SHCEntity
+from .entity import SHCEntity, async_add_entities_batched
 
 
 async def async_setup_entry(
@@ -38,7 +38,7 @@ async def async_setup_entry(
         )
 
     if entities:
-        async_add_entities(entities)
+        await async_add_entities_batched(async_add_entities, entities)
 
 
 class ShutterControlCover(SHCEntity, CoverEntity):
@@ -1,12 +1,21 @@
 """Bosch Smart Home Controller base entity."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from functools import partial
+
 from .device import SHCDevice
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry
 from homeassistant.helpers.device_registry import async_get as get_dev_reg
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 
+_SETUP_BATCH_SIZE = 32
+
 
 async def async_get_device_id(hass: HomeAssistant, device_id: str) -> None:
     """Get device id from device registry."""
@@ -29,6 +38,15 @@ async def async_remove_devices(
         dev_registry.async_update_device(device.id, remove_config_entry_id=entry_id)
 
 
+async def async_add_entities_batched(
+    async_add_entities: AddEntitiesCallback, entities: list[Entity]
+) -> None:
+    """Add entities in batches, yielding to the event loop in between."""
+    for index in range(0, len(entities), _SETUP_BATCH_SIZE):
+        async_add_entities(entities[index : index + _SETUP_BATCH_SIZE])
+        await asyncio.sleep(0)
+
+
 @callback
 def migrate_old_unique_ids(
     hass: HomeAssistant, platform: str, old_unique_id: str, new_key: str
@@ -43,26 +61,32 @@ def migrate_old_unique_ids(
 class SHCEntity(Entity):
     """Representation of a SHC base entity."""
 
+    __slots__ = ("_device", "_parent_id", "_entry_id")
+
+    _NAME_SUFFIX = ""
+    _UID_SUFFIX = ""
+
     def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
         """Initialize the generic SHC device."""
         self._device = device
         self._parent_id = parent_id
         self._entry_id = entry_id
-        self._attr_name = f"{device.name}"
-        self._attr_unique_id = f"{device.serial}"
+        self._attr_name = f"{device.name}{self._NAME_SUFFIX}"
+        self._attr_unique_id = f"{device.serial}{self._UID_SUFFIX}"
 
     async def async_added_to_hass(self):
         """Subscribe to SHC events."""
         await super().async_added_to_hass()
+        self._async_update_attrs()
 
         def on_state_changed():
-            self.schedule_update_ha_state()
+            self.hass.add_job(self._async_handle_state_changed)
 
         def update_entity_information():
             if self._device.deleted:
                 self.hass.add_job(async_remove_devices(self.hass, self, self._entry_id))
             else:
-                self.schedule_update_ha_state()
+                self.hass.add_job(self._async_handle_state_changed)
 
         for service in self._device.device_services:
             service.subscribe_callback(self.entity_id, on_state_changed)
@@ -75,6 +99,16 @@ class SHCEntity(Entity):
             service.unsubscribe_callback(self.entity_id)
         self._device.unsubscribe_callback(self.entity_id)
 
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the cached entity attributes from the device state."""
+
+    @callback
+    def _async_handle_state_changed(self) -> None:
+        """Refresh the cached attributes and write the new state."""
+        self._async_update_attrs()
+        self.async_write_ha_state()
+
     @property
     def device_name(self):
         """Name of the device."""
@@ -110,3 +144,37 @@ class SHCEntity(Entity):
     def should_poll(self):
         """Report polling mode. SHC Entity is communicating via long polling."""
         return False
+
+
+class SHCEventListenerEntity(SHCEntity, ABC):
+    """Representation of a SHC entity listening for device input events."""
+
+    __slots__ = ("_service", "_cached_device_id")
+
+    _EVENT_SERVICE_ID: str
+
+    def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
+        """Initialize the event listening SHC device."""
+        super().__init__(device=device, parent_id=parent_id, entry_id=entry_id)
+        self._cached_device_id = None
+        self._service = device.device_service(self._EVENT_SERVICE_ID)
+
+    async def async_added_to_hass(self):
+        """Subscribe to device input events."""
+        await super().async_added_to_hass()
+        self._cached_device_id = await async_get_device_id(self.hass, self._device.id)
+
+        if self._service is not None:
+            listener_id = self._device.id + "_eventlistener"
+            self._service.subscribe_callback(listener_id, self._input_events_handler)
+            self.async_on_remove(
+                partial(self._service.unsubscribe_callback, listener_id)
+            )
+
+    def _input_events_handler(self):
+        """Schedule handling of device input events on the event loop."""
+        self.hass.add_job(self._async_input_events_handler)
+
+    @abstractmethod
+    def _async_input_events_handler(self) -> None:
+        """Handle device input events."""
@@ -19,7 +19,7 @@ from homeassistant.util.color import (
 )
 
 from .const import DATA_SESSION, DOMAIN
-from .entity import SHCEntity
+from .entity import SHCEntity, async_add_entities_batched
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,7 +39,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         )
 
     if entities:
-        async_add_entities(entities)
+        await async_add_entities_batched(async_add_entities, entities)
 
 
 class LightSwitch(SHCEntity, LightEntity):
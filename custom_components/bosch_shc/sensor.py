@@ -1,6 +1,5 @@
 """Platform for sensor integration."""
 from __future__ import annotations
-from .device import SHCDevice
 from .session import SHCSession
 
 from homeassistant.components.sensor import (
@@ -16,11 +15,11 @@ from homeassistant.const import (
     POWER_WATT,
     TEMP_CELSIUS,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DATA_SESSION, DOMAIN
-from .entity import SHCEntity
+from .entity import SHCEntity, async_add_entities_batched
 
 
 async def async_setup_entry(
@@ -32,132 +31,20 @@ async def async_setup_entry(
     entities: list[SensorEntity] = []
     session: SHCSession = hass.data[DOMAIN][config_entry.entry_id][DATA_SESSION]
 
-    for sensor in session.device_helper.thermostats:
-        entities.append(
-            TemperatureSensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
+    parent_id = session.information.unique_id
+    for attr, sensor_classes in SENSOR_TYPES:
+        for sensor in getattr(session.device_helper, attr):
+            entities.extend(
+                sensor_class(
+                    device=sensor,
+                    parent_id=parent_id,
+                    entry_id=config_entry.entry_id,
+                )
+                for sensor_class in sensor_classes
             )
-        )
-        entities.append(
-            ValveTappetSensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-
-    for sensor in session.device_helper.wallthermostats:
-        entities.append(
-            TemperatureSensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-        entities.append(
-            HumiditySensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-
-    for sensor in session.device_helper.twinguards:
-        entities.append(
-            TemperatureSensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-        entities.append(
-            HumiditySensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-        entities.append(
-            PuritySensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-        entities.append(
-            AirQualitySensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-        entities.append(
-            TemperatureRatingSensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-        entities.append(
-            HumidityRatingSensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-        entities.append(
-            PurityRatingSensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-
-    for sensor in (
-        session.device_helper.smart_plugs + session.device_helper.light_switches
-    ):
-        entities.append(
-            PowerSensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-        entities.append(
-            EnergySensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-
-    for sensor in session.device_helper.smart_plugs_compact:
-        entities.append(
-            PowerSensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-        entities.append(
-            EnergySensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
-        entities.append(
-            CommunicationQualitySensor(
-                device=sensor,
-                parent_id=session.information.unique_id,
-                entry_id=config_entry.entry_id,
-            )
-        )
 
     if entities:
-        async_add_entities(entities)
+        await async_add_entities_batched(async_add_entities, entities)
 
 
 class TemperatureSensor(SHCEntity, SensorEntity):
@@ -166,12 +53,8 @@ class TemperatureSensor(SHCEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_native_unit_of_measurement = TEMP_CELSIUS
     _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
-        """Initialize an SHC temperature reporting sensor."""
-        super().__init__(device, parent_id, entry_id)
-        self._attr_name = f"{device.name} Temperature"
-        self._attr_unique_id = f"{device.serial}_temperature"
+    _NAME_SUFFIX = " Temperature"
+    _UID_SUFFIX = "_temperature"
 
     @property
     def native_value(self):
@@ -185,12 +68,8 @@ class HumiditySensor(SHCEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.HUMIDITY
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
-        """Initialize an SHC humidity reporting sensor."""
-        super().__init__(device, parent_id, entry_id)
-        self._attr_name = f"{device.name} Humidity"
-        self._attr_unique_id = f"{device.serial}_humidity"
+    _NAME_SUFFIX = " Humidity"
+    _UID_SUFFIX = "_humidity"
 
     @property
     def native_value(self):
@@ -204,12 +83,8 @@ class PuritySensor(SHCEntity, SensorEntity):
     _attr_icon = "mdi:molecule-co2"
     _attr_native_unit_of_measurement = CONCENTRATION_PARTS_PER_MILLION
     _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
-        """Initialize an SHC purity reporting sensor."""
-        super().__init__(device, parent_id, entry_id)
-        self._attr_name = f"{device.name} Purity"
-        self._attr_unique_id = f"{device.serial}_purity"
+    _NAME_SUFFIX = " Purity"
+    _UID_SUFFIX = "_purity"
 
     @property
     def native_value(self):
@@ -220,21 +95,18 @@ class PuritySensor(SHCEntity, SensorEntity):
 class AirQualitySensor(SHCEntity, SensorEntity):
     """Representation of an SHC airquality reporting sensor."""
 
-    def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
-        """Initialize an SHC airquality reporting sensor."""
-        super().__init__(device, parent_id, entry_id)
-        self._attr_name = f"{device.name} Air Quality"
-        self._attr_unique_id = f"{device.serial}_airquality"
+    _NAME_SUFFIX = " Air Quality"
+    _UID_SUFFIX = "_airquality"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
         return self._device.combined_rating.name
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        return {
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the cached entity attributes from the device state."""
+        self._attr_extra_state_attributes = {
             "rating_description": self._device.description,
         }
 
@@ -242,11 +114,8 @@ class AirQualitySensor(SHCEntity, SensorEntity):
 class TemperatureRatingSensor(SHCEntity, SensorEntity):
     """Representation of an SHC temperature rating sensor."""
 
-    def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
-        """Initialize an SHC temperature rating sensor."""
-        super().__init__(device, parent_id, entry_id)
-        self._attr_name = f"{device.name} Temperature Rating"
-        self._attr_unique_id = f"{device.serial}_temperature_rating"
+    _NAME_SUFFIX = " Temperature Rating"
+    _UID_SUFFIX = "_temperature_rating"
 
     @property
     def native_value(self):
@@ -258,12 +127,8 @@ class CommunicationQualitySensor(SHCEntity, SensorEntity):
     """Representation of an SHC communication quality reporting sensor."""
 
     _attr_icon = "mdi:wifi"
-
-    def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
-        """Initialize an SHC communication quality reporting sensor."""
-        super().__init__(device, parent_id, entry_id)
-        self._attr_name = f"{device.name} Communication Quality"
-        self._attr_unique_id = f"{device.serial}_communication_quality"
+    _NAME_SUFFIX = " Communication Quality"
+    _UID_SUFFIX = "_communication_quality"
 
     @property
     def native_value(self):
@@ -274,11 +139,8 @@ class CommunicationQualitySensor(SHCEntity, SensorEntity):
 class HumidityRatingSensor(SHCEntity, SensorEntity):
     """Representation of an SHC humidity rating sensor."""
 
-    def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
-        """Initialize an SHC humidity rating sensor."""
-        super().__init__(device, parent_id, entry_id)
-        self._attr_name = f"{device.name} Humidity Rating"
-        self._attr_unique_id = f"{device.serial}_humidity_rating"
+    _NAME_SUFFIX = " Humidity Rating"
+    _UID_SUFFIX = "_humidity_rating"
 
     @property
     def native_value(self):
@@ -289,11 +151,8 @@ class HumidityRatingSensor(SHCEntity, SensorEntity):
 class PurityRatingSensor(SHCEntity, SensorEntity):
     """Representation of an SHC purity rating sensor."""
 
-    def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
-        """Initialize an SHC purity rating sensor."""
-        super().__init__(device, parent_id, entry_id)
-        self._attr_name = f"{device.name} Purity Rating"
-        self._attr_unique_id = f"{device.serial}_purity_rating"
+    _NAME_SUFFIX = " Purity Rating"
+    _UID_SUFFIX = "_purity_rating"
 
     @property
     def native_value(self):
@@ -307,12 +166,8 @@ class PowerSensor(SHCEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.POWER
     _attr_native_unit_of_measurement = POWER_WATT
     _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
-        """Initialize an SHC power reporting sensor."""
-        super().__init__(device, parent_id, entry_id)
-        self._attr_name = f"{device.name} Power"
-        self._attr_unique_id = f"{device.serial}_power"
+    _NAME_SUFFIX = " Power"
+    _UID_SUFFIX = "_power"
 
     @property
     def native_value(self):
@@ -326,12 +181,8 @@ class EnergySensor(SHCEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_native_unit_of_measurement = ENERGY_KILO_WATT_HOUR
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
-        """Initialize an SHC energy reporting sensor."""
-        super().__init__(device, parent_id, entry_id)
-        self._attr_name = f"{self._device.name} Energy"
-        self._attr_unique_id = f"{self._device.serial}_energy"
+    _NAME_SUFFIX = " Energy"
+    _UID_SUFFIX = "_energy"
 
     @property
     def native_value(self):
@@ -344,21 +195,38 @@ class ValveTappetSensor(SHCEntity, SensorEntity):
 
     _attr_icon = "mdi:gauge"
     _attr_native_unit_of_measurement = PERCENTAGE
-
-    def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
-        """Initialize an SHC valve tappet reporting sensor."""
-        super().__init__(device, parent_id, entry_id)
-        self._attr_name = f"{device.name} Valvetappet"
-        self._attr_unique_id = f"{device.serial}_valvetappet"
+    _NAME_SUFFIX = " Valvetappet"
+    _UID_SUFFIX = "_valvetappet"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
         return self._device.position
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        return {
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the cached entity attributes from the device state."""
+        self._attr_extra_state_attributes = {
             "valve_tappet_state": self._device.valvestate.name,
         }
+
+
+SENSOR_TYPES = (
+    ("thermostats", (TemperatureSensor, ValveTappetSensor)),
+    ("wallthermostats", (TemperatureSensor, HumiditySensor)),
+    (
+        "twinguards",
+        (
+            TemperatureSensor,
+            HumiditySensor,
+            PuritySensor,
+            AirQualitySensor,
+            TemperatureRatingSensor,
+            HumidityRatingSensor,
+            PurityRatingSensor,
+        ),
+    ),
+    ("smart_plugs", (PowerSensor, EnergySensor)),
+    ("light_switches", (PowerSensor, EnergySensor)),
+    ("smart_plugs_compact", (PowerSensor, EnergySensor, CommunicationQualitySensor)),
+)
@@ -18,7 +18,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
 from .const import DATA_SESSION, DOMAIN
-from .entity import SHCEntity
+from .entity import SHCEntity, async_add_entities_batched
 
 
 @dataclass
@@ -149,7 +149,7 @@ async def async_setup_entry(
         )
 
     if entities:
-        async_add_entities(entities)
+        await async_add_entities_batched(async_add_entities, entities)
 
 
 class SHCSwitch(SHCEntity, SwitchEntity):
@@ -199,12 +199,8 @@ class SHCRoutingSwitch(SHCEntity, SwitchEntity):
 
     _attr_icon = "mdi:wifi"
     _attr_entity_category = EntityCategory.CONFIG
-
-    def __init__(self, device: SHCDevice, parent_id: str, entry_id: str) -> None:
-        """Initialize an SHC communication quality reporting sensor."""
-        super().__init__(device, parent_id, entry_id)
-        self._attr_name = f"{device.name} Routing"
-        self._attr_unique_id = f"{device.serial}_routing"
+    _NAME_SUFFIX = " Routing"
+    _UID_SUFFIX = "_routing"
 
     @property
     def is_on(self) -> bool:
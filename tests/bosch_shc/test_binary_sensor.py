@@ -0,0 +1,94 @@
+"""Test the Bosch SHC motion detection binary sensor."""
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.bosch_shc.binary_sensor import (
+    MOTION_TIMEOUT,
+    MotionDetectionSensor,
+)
+
+NOW = datetime(2021, 6, 1, 12, 0, 0, tzinfo=timezone.utc).timestamp()
+
+
+@pytest.fixture
+def motion_sensor(hass):
+    """Return a motion detection sensor for a mocked device."""
+    device = MagicMock()
+    device.id = "hdm:ZigBee:000d6f0012345678"
+    device.name = "Motion Detector"
+    device.serial = "000d6f0012345678"
+    device.device_services = []
+    sensor = MotionDetectionSensor(
+        device=device, parent_id="shc-mac", entry_id="entry-id"
+    )
+    sensor.hass = hass
+    sensor.entity_id = "binary_sensor.motion_detector"
+    return sensor
+
+
+def _update(sensor, latestmotion):
+    """Set the latest motion timestamp and refresh the sensor attributes."""
+    sensor._device.latestmotion = latestmotion
+    with patch(
+        "custom_components.bosch_shc.binary_sensor.time.time", return_value=NOW
+    ), patch(
+        "custom_components.bosch_shc.binary_sensor.async_call_later"
+    ) as mock_call_later:
+        sensor._async_update_attrs()
+    return mock_call_later
+
+
+async def test_recent_motion_turns_on(motion_sensor):
+    """Test a recent motion turns the sensor on and schedules clearing it."""
+    mock_call_later = _update(motion_sensor, "2021-06-01T11:59:00.000Z")
+
+    assert motion_sensor.is_on is True
+    mock_call_later.assert_called_once()
+    hass, delay, action = mock_call_later.call_args[0]
+    assert hass is motion_sensor.hass
+    assert delay == pytest.approx(MOTION_TIMEOUT - 60)
+    assert action == motion_sensor._async_clear_motion
+
+    with patch.object(motion_sensor, "async_write_ha_state") as mock_write:
+        action(None)
+    assert motion_sensor.is_on is False
+    mock_write.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "latestmotion", ["2021-06-01T11:50:00.000Z", "n/a"], ids=["stale", "n/a"]
+)
+async def test_no_recent_motion_is_off(motion_sensor, latestmotion):
+    """Test a stale or unknown motion timestamp is off without a timer."""
+    mock_call_later = _update(motion_sensor, latestmotion)
+
+    assert motion_sensor.is_on is False
+    mock_call_later.assert_not_called()
+    assert motion_sensor._clear_motion_unsub is None
+
+
+async def test_new_motion_reschedules_clear(motion_sensor):
+    """Test a new motion event cancels the pending clear timer."""
+    first_call_later = _update(motion_sensor, "2021-06-01T11:59:00.000Z")
+    first_unsub = first_call_later.return_value
+
+    second_call_later = _update(motion_sensor, "2021-06-01T11:59:30.000Z")
+
+    first_unsub.assert_called_once()
+    second_call_later.assert_called_once()
+    assert second_call_later.call_args[0][1] == pytest.approx(MOTION_TIMEOUT - 30)
+    assert motion_sensor._clear_motion_unsub is second_call_later.return_value
+    assert motion_sensor.is_on is True
+
+
+async def test_remove_cancels_clear(motion_sensor):
+    """Test removing the entity cancels the pending clear timer."""
+    mock_call_later = _update(motion_sensor, "2021-06-01T11:59:00.000Z")
+    unsub = mock_call_later.return_value
+
+    await motion_sensor.async_will_remove_from_hass()
+
+    unsub.assert_called_once()
+    assert motion_sensor._clear_motion_unsub is None